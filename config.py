@@ -1,4 +1,5 @@
 import chess
+import os
 import random
 import threading
 from stockfish import Stockfish
@@ -10,6 +11,7 @@ BOARD_SIZE = 600  # Keep the board size fixed
 EXTRA_SPACE = 150  # Add extra space at the bottom for information
 SIZE = (BOARD_SIZE, BOARD_SIZE + EXTRA_SPACE)
 SCALING_FACTOR = 0.93  # Adjust this factor to align the board as needed
+SVG_CACHE_SIZE = 4  # Rendered board SVGs kept for reuse, enough for the current view and its drag variants
 
 # Calculate margin and square size
 MARGIN = (BOARD_SIZE - BOARD_SIZE * SCALING_FACTOR) / 2
@@ -19,8 +21,8 @@ SQUARE_SIZE = (BOARD_SIZE * SCALING_FACTOR) / 8
 STOCKFISH_PATH = r"/home/sheg/Downloads/stockfish-ubuntu-x86-64-sse41-popcnt/stockfish/stockfish-ubuntu-x86-64-sse41-popcnt"  # Set the correct path to your Stockfish binary
 STOCKFISH_SKILL_LEVEL = 12  # You can adjust the skill level
 
-# Select opening before loading the main game
-SELECTED_OPENING = select_opening(openings.keys())  # Choose from the available openings
+# Select opening before loading the main game (set CHESS_TRAINER_OPENING to skip the dialog)
+SELECTED_OPENING = os.environ.get("CHESS_TRAINER_OPENING") or select_opening(openings.keys())  # Choose from the available openings
 OPENING_LINES = openings[SELECTED_OPENING]
 SELECTED_LINE = random.choice(OPENING_LINES)  # Select one random line at the start
 OPENING_MOVES = openings  # Store all openings
@@ -0,0 +1,228 @@
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+import chess
+import chess.polyglot
+from stockfish import Stockfish
+from openings import openings
+
+# Analysis configuration
+DEFAULT_DEPTH = 18  # Search depth for every position
+DEFAULT_MULTIPV = 4  # Number of candidate replies to look at per position
+DEFAULT_MARGIN = 50  # Replies within this many centipawns of the best move count as strong
+DEFAULT_CHECKPOINT = "gap_finder_checkpoint.json"
+CHECKPOINT_INTERVAL = 25  # Save progress after this many analyzed positions
+MATE_SCORE = 100000  # Centipawn value used to rank mate scores above everything else
+
+# One engine per worker process, created by init_worker
+worker_engine = None
+
+
+def collect_positions(repertoire):
+    """Walk every line and collect the Black-to-move positions, keyed by Zobrist hash.
+
+    Transposed positions share a key, so their scripted replies and line names are merged.
+    """
+    positions = {}
+    for opening_name, lines in repertoire.items():
+        for line in lines:
+            line_board = chess.Board()
+            for ply, uci in enumerate(line['moves']):
+                move = chess.Move.from_uci(uci)
+                if move not in line_board.legal_moves:
+                    # Later positions of this line would be corrupt, so stop walking it
+                    print(f"Skipping the rest of {opening_name} - {line['name']}: illegal move {uci} at ply {ply}")
+                    break
+                if line_board.turn == chess.BLACK:
+                    key = format(chess.polyglot.zobrist_hash(line_board), '016x')
+                    entry = positions.setdefault(key, {
+                        'fen': line_board.fen(),
+                        'ply': ply,
+                        'covered': [],
+                        'lines': [],
+                    })
+                    entry['ply'] = min(entry['ply'], ply)
+                    if uci not in entry['covered']:
+                        entry['covered'].append(uci)
+                    line_label = f"{opening_name} - {line['name']}"
+                    if line_label not in entry['lines']:
+                        entry['lines'].append(line_label)
+                line_board.push(move)
+    return positions
+
+
+def score_for_black(top_move):
+    # Stockfish reports scores from White's point of view
+    if top_move['Mate'] is not None:
+        mate = top_move['Mate']
+        white_score = MATE_SCORE - abs(mate) if mate > 0 else -MATE_SCORE + abs(mate)
+    else:
+        white_score = top_move['Centipawn']
+    return -white_score
+
+
+def format_score(score):
+    if abs(score) > MATE_SCORE // 2:
+        moves_to_mate = MATE_SCORE - abs(score)
+        return f"M{moves_to_mate}" if score > 0 else f"M-{moves_to_mate}"
+    return f"{score / 100.0:+.2f}"
+
+
+def start_engine(stockfish_path, depth, multipv):
+    # Setting MultiPV up front stops get_top_moves from changing it around every search
+    return Stockfish(stockfish_path, depth=depth, parameters={"Threads": 1, "Hash": 64, "MultiPV": multipv})
+
+
+def init_worker(stockfish_path, depth, multipv):
+    global worker_engine
+    worker_engine = start_engine(stockfish_path, depth, multipv)
+
+
+def analyze_position(job):
+    key, fen = job
+    # Skip ucinewgame so the hash table carries over between related positions
+    worker_engine.set_fen_position(fen, False)
+    top_moves = worker_engine.get_top_moves(worker_engine.get_parameters()["MultiPV"])
+    return key, [{'move': top_move['Move'], 'score': score_for_black(top_move)} for top_move in top_moves]
+
+
+def load_checkpoint(path, depth, multipv):
+    """Return the analyzed results and the CPU seconds already spent on them."""
+    if not os.path.exists(path):
+        return {}, 0.0
+    with open(path) as checkpoint_file:
+        checkpoint = json.load(checkpoint_file)
+    # A checkpoint from other search settings is started over
+    if checkpoint.get('depth') != depth or checkpoint.get('multipv') != multipv:
+        print("Checkpoint was made with a different --depth or --multipv, starting over")
+        return {}, 0.0
+    return checkpoint['results'], checkpoint['cpu_seconds']
+
+
+def save_checkpoint(path, depth, multipv, results, cpu_seconds):
+    checkpoint = {'depth': depth, 'multipv': multipv, 'cpu_seconds': cpu_seconds, 'results': results}
+    # Write to a temporary file first so an interrupted run never leaves a truncated checkpoint
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+    os.replace(temp_path, path)
+
+
+def find_gaps(positions, results, margin):
+    gaps = []
+    for key, entry in positions.items():
+        if key not in results:
+            continue
+        candidates = results[key]
+        if not candidates:
+            continue
+        best_score = candidates[0]['score']
+        for candidate in candidates:
+            if candidate['move'] in entry['covered']:
+                continue
+            if best_score - candidate['score'] > margin:
+                continue
+            gaps.append({
+                'fen': entry['fen'],
+                'move': candidate['move'],
+                'score': candidate['score'],
+                'covered': entry['covered'],
+                'lines': entry['lines'],
+            })
+    # Best replies for Black first
+    gaps.sort(key=lambda gap: gap['score'], reverse=True)
+    return gaps
+
+
+def print_report(gaps):
+    if not gaps:
+        print("No uncovered strong replies found.")
+        return
+    print(f"Found {len(gaps)} uncovered strong replies:")
+    for gap in gaps:
+        gap_board = chess.Board(gap['fen'])
+        reply = gap_board.san(chess.Move.from_uci(gap['move']))
+        covered = ", ".join(gap_board.san(chess.Move.from_uci(uci)) for uci in gap['covered'])
+        print(f"{format_score(gap['score']):>7}  {reply:<7} (repertoire: {covered})  {gap['fen']}")
+        for line_label in gap['lines']:
+            print(f"         in {line_label}")
+
+
+def run_analysis(args):
+    positions = collect_positions(openings)
+    results, spent_seconds = load_checkpoint(args.checkpoint, args.depth, args.multipv)
+    # Shallow positions are reached most often, so analyze them first in case the budget runs out
+    pending = sorted(
+        (key for key in positions if key not in results),
+        key=lambda key: positions[key]['ply'],
+    )
+    print(f"{len(positions)} unique Black-to-move positions, {len(results)} already analyzed, {len(pending)} pending")
+
+    # The budget is in CPU-hours across all resumed runs, and each worker runs a single-threaded engine
+    started = time.monotonic()
+    deadline = None
+    if args.budget_hours is not None:
+        remaining_seconds = args.budget_hours * 3600 - spent_seconds
+        if pending and remaining_seconds <= 0:
+            print("CPU budget already used up, raise --budget-hours to analyze the pending positions.")
+            pending = []
+        deadline = started + remaining_seconds / args.workers
+
+    def cpu_seconds():
+        return spent_seconds + (time.monotonic() - started) * args.workers
+
+    if pending:
+        jobs = [(key, positions[key]['fen']) for key in pending]
+        initargs = (args.stockfish, args.depth, args.multipv)
+        with multiprocessing.Pool(args.workers, initializer=init_worker, initargs=initargs) as pool:
+            try:
+                for done, (key, candidates) in enumerate(pool.imap_unordered(analyze_position, jobs), start=1):
+                    results[key] = candidates
+                    if done % CHECKPOINT_INTERVAL == 0:
+                        save_checkpoint(args.checkpoint, args.depth, args.multipv, results, cpu_seconds())
+                        print(f"Analyzed {done}/{len(jobs)} positions")
+                    if deadline is not None and time.monotonic() > deadline:
+                        print("CPU budget exhausted, stopping. Raise --budget-hours and run again to resume.")
+                        pool.terminate()
+                        break
+            finally:
+                save_checkpoint(args.checkpoint, args.depth, args.multipv, results, cpu_seconds())
+        print(f"{cpu_seconds() / 3600:.2f} CPU-hours used in total")
+
+    print_report(find_gaps(positions, results, args.margin))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find strong Black replies that the repertoire does not cover.")
+    parser.add_argument("--stockfish", required=True, help="Path to the Stockfish binary")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of engine processes")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="Search depth per position")
+    parser.add_argument("--multipv", type=int, default=DEFAULT_MULTIPV, help="Candidate replies per position")
+    parser.add_argument("--margin", type=int, default=DEFAULT_MARGIN,
+                        help="Centipawns behind the best reply that still count as strong")
+    parser.add_argument("--budget-hours", type=float, default=None, help="CPU-hour budget shared by all resumed runs")
+    parser.add_argument("--checkpoint", default=DEFAULT_CHECKPOINT, help="Checkpoint file used to resume")
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not (os.path.isfile(args.stockfish) and os.access(args.stockfish, os.X_OK)):
+        parser.error(f"{args.stockfish} is not an executable file")
+    # Start one engine up front, a broken path would otherwise make the pool respawn workers forever
+    try:
+        start_engine(args.stockfish, args.depth, args.multipv)
+    except Exception as e:
+        parser.error(f"could not start Stockfish at {args.stockfish}: {e}")
+
+    try:
+        run_analysis(args)
+    except KeyboardInterrupt:
+        print("Interrupted. Run again to resume from the checkpoint.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from PyQt5.QtCore import Qt, QThread, pyqtSignal, QRect, QPoint
 from PyQt5.QtGui import QPainter, QColor, QPen, QPixmap, QCursor, QImage
 import os
 import time
+from collections import OrderedDict
 from config import (
     BOARD_SIZE,
     EXTRA_SPACE,
@@ -21,6 +22,7 @@ from config import (
     SELECTED_LINE,
     SELECTED_OPENING,
     SCALING_FACTOR,
+    SVG_CACHE_SIZE,
 )
 
 # Debug function
@@ -84,6 +86,13 @@ class ChessBoard(QWidget):
         self.show_dragged_piece = False
         self.debug_count = 0
         
+        # Pooled drag and board resources, so repeated moves don't allocate new Qt objects
+        self.piece_renderer = QSvgRenderer()
+        self.piece_pixmaps = {}
+        self.piece_cursors = {}
+        self.svg_cache = OrderedDict()
+        self.current_svg_key = None
+        
         # Create main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -192,32 +201,45 @@ class ChessBoard(QWidget):
         last_move = board.peek() if board.move_stack else None
         check_square = board.king(board.turn) if board.is_check() else None
         
-        # If we're dragging a piece, remove it from the board view
-        if dragging_square is not None:
-            debug_print(f"Updating board with dragging_square={dragging_square}")
-            # Create a temporary board for drawing
-            temp_board = chess.Board(board.fen())
-            # Remove the piece being dragged
-            temp_board.remove_piece_at(dragging_square)
-            # Generate SVG showing the board without the dragged piece
-            svg_data = chess.svg.board(
-                temp_board,
-                size=BOARD_SIZE,
-                coordinates=True,
-                lastmove=last_move,
-                check=check_square
-            )
+        # Reuse the rendered SVG if we've already drawn this exact view
+        svg_key = (board.board_fen(), last_move, check_square, dragging_square)
+        svg_bytes = self.svg_cache.get(svg_key)
+        if svg_bytes is not None:
+            self.svg_cache.move_to_end(svg_key)
         else:
-            # Regular board update
-            svg_data = chess.svg.board(
-                board,
-                size=BOARD_SIZE,
-                coordinates=True,
-                lastmove=last_move,
-                check=check_square
-            )
-            
-        self.svg_widget.load(bytes(svg_data, 'utf-8'))
+            # If we're dragging a piece, remove it from the board view
+            if dragging_square is not None:
+                debug_print(f"Updating board with dragging_square={dragging_square}")
+                # Create a temporary board for drawing
+                temp_board = chess.Board(board.fen())
+                # Remove the piece being dragged
+                temp_board.remove_piece_at(dragging_square)
+                # Generate SVG showing the board without the dragged piece
+                svg_data = chess.svg.board(
+                    temp_board,
+                    size=BOARD_SIZE,
+                    coordinates=True,
+                    lastmove=last_move,
+                    check=check_square
+                )
+            else:
+                # Regular board update
+                svg_data = chess.svg.board(
+                    board,
+                    size=BOARD_SIZE,
+                    coordinates=True,
+                    lastmove=last_move,
+                    check=check_square
+                )
+            svg_bytes = bytes(svg_data, 'utf-8')
+            self.svg_cache[svg_key] = svg_bytes
+            if len(self.svg_cache) > SVG_CACHE_SIZE:
+                self.svg_cache.popitem(last=False)
+        
+        # Only reload the widget when the view actually changed
+        if svg_key != self.current_svg_key:
+            self.svg_widget.load(svg_bytes)
+            self.current_svg_key = svg_key
         
         # Update opening info
         current_opening = SELECTED_OPENING
@@ -230,6 +252,28 @@ class ChessBoard(QWidget):
         moves_left = len(SELECTED_LINE['moves']) - self.opening_index if SELECTED_LINE and 'moves' in SELECTED_LINE else 0
         self.opening_info.setText(f"Opening: {current_opening} - {current_line_name} (Moves Left: {moves_left})")
         
+    def get_piece_pixmap(self, piece):
+        symbol = piece.symbol()
+        if symbol not in self.piece_pixmaps:
+            # Create a custom cursor with the piece image
+            debug_print(f"Creating pixmap for {symbol}")
+            square_size_int = int(SQUARE_SIZE)
+            
+            # Create a transparent pixmap for the cursor
+            pixmap = QPixmap(square_size_int, square_size_int)
+            pixmap.fill(Qt.transparent)
+            
+            # Draw the chess piece on the transparent background
+            painter = QPainter(pixmap)
+            piece_svg = chess.svg.piece(piece, size=square_size_int)
+            self.piece_renderer.load(bytes(piece_svg, 'utf-8'))
+            self.piece_renderer.render(painter)
+            painter.end()
+            
+            self.piece_pixmaps[symbol] = pixmap
+            self.piece_cursors[symbol] = QCursor(pixmap)
+        return self.piece_pixmaps[symbol]
+        
     def handle_mouse_press(self, event):
         x, y = event.x(), event.y()
         file = int(x / SQUARE_SIZE)
@@ -247,29 +291,8 @@ class ChessBoard(QWidget):
                 self.dragging_piece = piece
                 
                 try:
-                    # Create a custom cursor with the piece image
-                    debug_print("Creating pixmap for cursor")
-                    square_size_int = int(SQUARE_SIZE)
-                    
-                    # Create a transparent pixmap for the cursor
-                    self.dragging_pixmap = QPixmap(square_size_int, square_size_int)
-                    self.dragging_pixmap.fill(Qt.transparent)  # Use transparent instead of red
-                    
-                    # Draw the chess piece on the transparent background
-                    painter = QPainter(self.dragging_pixmap)
-                    
-                    # Get piece SVG content
-                    piece_svg = chess.svg.piece(piece, size=square_size_int)
-                    
-                    # Create a renderer and render the SVG
-                    renderer = QSvgRenderer(bytes(piece_svg, 'utf-8'))
-                    renderer.render(painter)
-                    painter.end()
-                    
-                    # Save the pixmap for debugging
-                    debug_file = "debug_piece.png"
-                    self.dragging_pixmap.save(debug_file)
-                    debug_print(f"Saved debug pixmap to {debug_file}, exists: {os.path.exists(debug_file)}")
+                    # Reuse the pooled pixmap for this piece
+                    self.dragging_pixmap = self.get_piece_pixmap(piece)
                     
                     # Update cursor position and show the dragged piece
                     self.drag_position = QPoint(x, y)
@@ -291,9 +314,8 @@ class ChessBoard(QWidget):
                         self.possible_moves = [move.to_square for move in board.legal_moves if move.from_square == square]
                     
                     # USE A CUSTOM CURSOR
-                    # Create a custom cursor that's definitely visible
-                    custom_cursor = QCursor(self.dragging_pixmap)
-                    self.board_widget.setCursor(custom_cursor)
+                    # Reuse the pooled cursor built from the piece pixmap
+                    self.board_widget.setCursor(self.piece_cursors[piece.symbol()])
                     debug_print("Set custom cursor")
                     
                     # Force redraw
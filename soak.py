@@ -0,0 +1,194 @@
+import argparse
+import contextlib
+import csv
+import gc
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+# Run without a display and skip the opening dialog; both must be set before Qt and config are imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("CHESS_TRAINER_OPENING", "Ruy Lopez")
+
+import chess
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QObject, QPoint
+from PyQt5.QtGui import QPixmap, QCursor, QPainter
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtTest import QTest
+
+# Soak configuration
+DEFAULT_LINES = 200  # Full opening lines to replay
+DEFAULT_DRAGS = 2000  # Extra drags that are dropped off the board
+DEFAULT_SAMPLE_EVERY = 100  # Take a memory sample after this many drags
+DRAG_STEPS = 5  # Mouse move events per drag
+ENGINE_DEPTH = 1  # Keep Stockfish cheap, the soak measures the GUI
+TRACKED_TYPES = (QPixmap, QCursor, QPainter, QSvgRenderer)  # Python-side wrappers counted in each sample
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+import main
+from config import SQUARE_SIZE, stockfish, OPENING_MOVES
+
+OFF_BOARD = int(8 * SQUARE_SIZE) + 10  # Pixel coordinate past the last square, used to cancel drags
+
+
+def square_center(square):
+    file = chess.square_file(square)
+    rank = chess.square_rank(square)
+    return QPoint(int((file + 0.5) * SQUARE_SIZE), int((7.5 - rank) * SQUARE_SIZE))
+
+
+def drag(widget, start, end):
+    QTest.mousePress(widget, Qt.LeftButton, Qt.NoModifier, start)
+    app.processEvents()
+    for step in range(1, DRAG_STEPS + 1):
+        position = start + (end - start) * step / DRAG_STEPS
+        QTest.mouseMove(widget, position)
+        app.processEvents()
+    QTest.mouseRelease(widget, Qt.LeftButton, Qt.NoModifier, end)
+    app.processEvents()
+
+
+def read_rss_kb():
+    # Current RSS is only available from /proc, peak RSS elsewhere can't show growth
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return None
+
+
+def count_constructions(module):
+    """Replace the tracked Qt classes in module with subclasses that count how often they are built."""
+    counts = {}
+    for base in TRACKED_TYPES:
+        name = base.__name__
+        counts[name] = 0
+
+        def __init__(self, *args, _base=base, _name=name, **kwargs):
+            counts[_name] += 1
+            _base.__init__(self, *args, **kwargs)
+
+        setattr(module, name, type(name, (base,), {'__init__': __init__}))
+    return counts
+
+
+def take_sample(window, drags, started, constructions):
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    wrappers = sum(1 for obj in gc.get_objects() if isinstance(obj, TRACKED_TYPES))
+    return {
+        'seconds': round(time.monotonic() - started, 2),
+        'drags': drags,
+        'rss_kb': read_rss_kb(),
+        'traced_kb': current // 1024,
+        'traced_peak_kb': peak // 1024,
+        'qt_widgets': len(QApplication.allWidgets()),
+        'qt_children': len(window.findChildren(QObject)),
+        'qt_wrappers': wrappers,
+        **{f'new_{name}': count for name, count in constructions.items()},
+    }
+
+
+class Soak:
+    def __init__(self, window, sample_every, constructions):
+        self.window = window
+        self.constructions = constructions
+        self.widget = window.chess_board.board_widget
+        self.sample_every = sample_every
+        self.drags = 0
+        self.samples = []
+        self.started = time.monotonic()
+
+    def after_drag(self):
+        self.drags += 1
+        if self.drags % self.sample_every == 0:
+            self.samples.append(take_sample(self.window, self.drags, self.started, self.constructions))
+            print(f"{self.drags} drags, RSS {self.samples[-1]['rss_kb']} kB", file=sys.stderr)
+
+    def replay_line(self, opening_name, line):
+        self.window.opening_selector.setCurrentText(opening_name)
+        self.window.line_selector.setCurrentText(line['name'])
+        self.window.reset_position()
+        # Drag every White move, the trainer answers with the scripted Black moves
+        for uci in line['moves'][::2]:
+            if main.board.turn != chess.WHITE:
+                break
+            move = chess.Move.from_uci(uci)
+            drag(self.widget, square_center(move.from_square), square_center(move.to_square))
+            self.after_drag()
+
+    def cancelled_drag(self):
+        # Pick up a White piece and drop it off the board, which only redraws
+        self.window.reset_position()
+        drag(self.widget, square_center(chess.E2), QPoint(OFF_BOARD, OFF_BOARD))
+        self.after_drag()
+
+
+def report(samples, warmup):
+    if len(samples) <= warmup + 1:
+        print("Not enough samples to measure growth, run more lines or drags.")
+        return
+    first, last = samples[warmup], samples[-1]
+    drags = last['drags'] - first['drags']
+    if drags == 0:
+        print("No drags after warmup, run more lines or drags.")
+        return
+    print(f"Steady state over {drags} drags (after {warmup} warmup samples):")
+    print(f"  {'seconds':<13} {(last['seconds'] - first['seconds']) / drags * 1000:.1f} ms per drag")
+    for field in ('rss_kb', 'traced_kb', 'qt_widgets', 'qt_children', 'qt_wrappers'):
+        if last[field] is None:
+            print(f"  {field:<13} unavailable, current RSS is only read from /proc")
+            continue
+        growth = last[field] - first[field]
+        print(f"  {field:<13} {first[field]:>9} -> {last[field]:>9}  ({growth:+}, {growth / drags:+.3f} per drag)")
+    # Constructions are counted, not retained, so they show allocation churn that memory totals hide
+    print("Qt objects constructed per drag:")
+    for name in (base.__name__ for base in TRACKED_TYPES):
+        built = last[f'new_{name}'] - first[f'new_{name}']
+        print(f"  {name:<13} {built:>9}  ({built / drags:.3f} per drag)")
+
+
+def main_soak():
+    parser = argparse.ArgumentParser(description="Replay drags and opening lines offscreen and record memory over time.")
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES, help="Full opening lines to replay")
+    parser.add_argument("--drags", type=int, default=DEFAULT_DRAGS, help="Extra drags dropped off the board")
+    parser.add_argument("--sample-every", type=int, default=DEFAULT_SAMPLE_EVERY, help="Drags between samples")
+    parser.add_argument("--warmup", type=int, default=2, help="Samples ignored before measuring growth")
+    parser.add_argument("--output", default="soak_samples.csv", help="CSV file for the samples")
+    args = parser.parse_args()
+
+    stockfish.set_depth(ENGINE_DEPTH)
+    tracemalloc.start()
+
+    constructions = count_constructions(main)
+    all_lines = [(opening_name, line) for opening_name, lines in OPENING_MOVES.items() for line in lines]
+
+    # The trainer logs every event, keep that out of the report
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        window = main.MainWindow()
+        window.show()
+        app.processEvents()
+
+        soak = Soak(window, args.sample_every, constructions)
+        soak.samples.append(take_sample(window, 0, soak.started, constructions))
+        for index in range(args.lines):
+            soak.replay_line(*all_lines[index % len(all_lines)])
+        for _ in range(args.drags):
+            soak.cancelled_drag()
+        if soak.drags != soak.samples[-1]['drags']:
+            soak.samples.append(take_sample(window, soak.drags, soak.started, constructions))
+
+    with open(args.output, 'w', newline='') as output:
+        writer = csv.DictWriter(output, fieldnames=list(soak.samples[0]))
+        writer.writeheader()
+        writer.writerows(soak.samples)
+    print(f"Wrote {len(soak.samples)} samples to {args.output}")
+    report(soak.samples, args.warmup)
+
+
+if __name__ == "__main__":
+    main_soak()